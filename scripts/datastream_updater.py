@@ -4,6 +4,7 @@ import os
 import mimetypes
 from datetime import datetime
 import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
 
 NAMESPACES = {
     'foxml': 'info:fedora/fedora-system:def/foxml#'
@@ -14,48 +15,59 @@ def register_namespaces():
     for prefix, uri in NAMESPACES.items():
         ET.register_namespace(prefix, uri)
 
-def update_foxml_datastream(input_path, output_path, dsid, content_file, label, mimetype, control_group):
+LINE_WIDTH = 76
+DATASTREAM_INDENT = '  '
+VERSION_INDENT = DATASTREAM_INDENT + '  '
+CONTENT_INDENT = VERSION_INDENT + '  '
+BASE64_INDENT = ' ' * 14
+
+
+def encode_content_file(content_file):
     """
-    Adds or replaces a datastream in a FOXML file with Base64 encoded content,
-    with precise indentation and multi-line formatting that preserves the original document's style.
+    Reads a content file and Base64 encodes it into fixed-width lines.
+
+    Intended to run on a worker thread. Only the file read releases the GIL;
+    the Base64 encoding and line chunking hold it, so running this on a pool
+    overlaps file I/O with parsing but does not encode files in parallel.
 
     Args:
-        input_path (str): Path to the source FOXML file.
-        output_path (str): Path to save the modified FOXML file.
-        dsid (str): The ID of the datastream to add/update (e.g., 'OBJ', 'MODS').
-        content_file (str): Path to the file containing the new content.
-        label (str): The label for the new datastream version.
-        mimetype (str): The MIME type of the content file.
-        control_group (str): The control group for the datastream (e.g., 'M', 'X').
-    """
-    if not os.path.exists(content_file):
-        print(f"Error: Content file not found at '{content_file}'")
-        return
+        content_file (str): Path to the file containing the content.
 
-    print(f"Reading content from '{content_file}'...")
+    Returns:
+        tuple: The list of encoded lines and the original size in bytes.
+    """
     with open(content_file, 'rb') as f:
         binary_content_bytes = f.read()
-    
+
     encoded_content_string = base64.b64encode(binary_content_bytes).decode('ascii')
-    content_size = os.path.getsize(content_file)
-    print(f"Content read successfully. Original size: {content_size} bytes.")
+    chunks = [encoded_content_string[i:i + LINE_WIDTH] for i in range(0, len(encoded_content_string), LINE_WIDTH)]
+    return chunks, len(binary_content_bytes)
 
-    register_namespaces()
-    try:
-        tree = ET.parse(input_path)
-        root = tree.getroot()
-    except ET.ParseError as e:
-        print(f"Error parsing XML file '{input_path}': {e}")
-        return
+
+def append_datastream_version(root, update, chunks, content_size, created_timestamp):
+    """
+    Adds a new datastream version to the parsed FOXML tree, creating the
+    datastream if it does not exist yet.
+
+    Args:
+        root (Element): The root digitalObject element of the FOXML tree.
+        update (dict): The datastream update, as passed to update_foxml_datastreams.
+        chunks (list): The Base64 encoded content lines.
+        content_size (int): The original size of the content in bytes.
+        created_timestamp (str): The CREATED timestamp for the new version.
+
+    Returns:
+        str: The ID of the new datastream version.
+    """
+    dsid = update['dsid']
+    content_file = update['content_file']
+    label = update.get('label')
+    mimetype = update.get('mimetype')
+    control_group = update.get('control_group') or 'M'
 
     datastream_xpath = f"./foxml:datastream[@ID='{dsid}']"
     datastream = root.find(datastream_xpath, NAMESPACES)
-    
-    datastream_indent = '  '
-    version_indent = datastream_indent + '  '
-    content_indent = version_indent + '  '
-    base64_indent = ' ' * 14
-    
+
     if datastream is None:
         print(f"Datastream with ID '{dsid}' not found. Creating a new one.")
         datastream = ET.SubElement(root, f"{{{NAMESPACES['foxml']}}}datastream", {
@@ -64,13 +76,12 @@ def update_foxml_datastream(input_path, output_path, dsid, content_file, label,
         if len(root) > 1:
             prev_sibling = root[-2]
             datastream.tail = prev_sibling.tail
-            prev_sibling.tail = '\n' + datastream_indent
+            prev_sibling.tail = '\n' + DATASTREAM_INDENT
         else:
-            root.text = '\n' + datastream_indent
+            root.text = '\n' + DATASTREAM_INDENT
             datastream.tail = '\n'
-            
-        datastream.text = '\n' + version_indent
-        last_version = None
+
+        datastream.text = '\n' + VERSION_INDENT
         version_num = 0
 
     else:
@@ -79,20 +90,16 @@ def update_foxml_datastream(input_path, output_path, dsid, content_file, label,
         last_version = versions[-1] if versions else None
         version_num = len(versions)
         if last_version is not None:
-            last_version.tail = '\n' + version_indent
+            last_version.tail = '\n' + VERSION_INDENT
         else:
-            datastream.text = '\n' + version_indent
+            datastream.text = '\n' + VERSION_INDENT
 
     new_version_id = f"{dsid}.{version_num}"
-    now = datetime.utcnow()
-    main_part = now.strftime('%Y-%m-%dT%H:%M:%S')
-    milliseconds = f'{now.microsecond // 1000:03d}'
-    created_timestamp = f'{main_part}.{milliseconds}Z'
 
     if not mimetype:
         mimetype, _ = mimetypes.guess_type(content_file)
         mimetype = mimetype or 'application/octet-stream'
-        print(f"Guessed MIME type: '{mimetype}'")
+        print(f"Guessed MIME type for '{dsid}': '{mimetype}'")
 
     if not label:
         label = f"{dsid} datastream"
@@ -102,34 +109,122 @@ def update_foxml_datastream(input_path, output_path, dsid, content_file, label,
         'MIMETYPE': mimetype, 'SIZE': str(content_size)
     }
     ds_version = ET.SubElement(datastream, f"{{{NAMESPACES['foxml']}}}datastreamVersion", ds_version_attrs)
-    
-    ds_version.text = '\n' + content_indent
-    ds_version.tail = '\n' + datastream_indent
+
+    ds_version.text = '\n' + CONTENT_INDENT
+    ds_version.tail = '\n' + DATASTREAM_INDENT
 
     binary_content_element = ET.SubElement(ds_version, f"{{{NAMESPACES['foxml']}}}binaryContent")
-    
-    LINE_WIDTH = 76
-    chunks = [encoded_content_string[i:i + LINE_WIDTH] for i in range(0, len(encoded_content_string), LINE_WIDTH)]
-    
+
     binary_content_element.text = (
-        f"\n{base64_indent}" + 
-        f"\n{base64_indent}".join(chunks) +
-        f"\n{content_indent}"
+        f"\n{BASE64_INDENT}" +
+        f"\n{BASE64_INDENT}".join(chunks) +
+        f"\n{CONTENT_INDENT}"
     )
 
-    binary_content_element.tail = '\n' + version_indent
+    binary_content_element.tail = '\n' + VERSION_INDENT
+
+    return new_version_id
+
+
+def update_foxml_datastreams(input_path, output_path, updates, max_workers=None):
+    """
+    Adds or replaces several datastreams in a FOXML file with Base64 encoded content,
+    parsing and writing the document only once for all of them.
+
+    The content files are read on a thread pool while the FOXML is parsed, so file
+    I/O overlaps with parsing; all new versions share the same CREATED timestamp.
+
+    Args:
+        input_path (str): Path to the source FOXML file.
+        output_path (str): Path to save the modified FOXML file.
+        updates (list): Datastream updates, each a dict with the keys 'dsid' and
+            'content_file', and optionally 'label', 'mimetype' and 'control_group'.
+            Each 'dsid' may appear only once, as all new versions share one timestamp.
+        max_workers (int, optional): Number of encoding threads. Defaults to the
+            ThreadPoolExecutor default.
+    """
+    dsids = [update['dsid'] for update in updates]
+    duplicate_dsids = sorted({dsid for dsid in dsids if dsids.count(dsid) > 1})
+    if duplicate_dsids:
+        print(f"Error: Datastream IDs given more than once: {', '.join(duplicate_dsids)}")
+        return
+
+    for update in updates:
+        if not os.path.isfile(update['content_file']):
+            print(f"Error: Content file not found at '{update['content_file']}'")
+            return
+        if not os.access(update['content_file'], os.R_OK):
+            print(f"Error: Content file '{update['content_file']}' is not readable")
+            return
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = []
+        for update in updates:
+            print(f"Reading content for '{update['dsid']}' from '{update['content_file']}'...")
+            futures.append(executor.submit(encode_content_file, update['content_file']))
+
+        register_namespaces()
+        try:
+            tree = ET.parse(input_path)
+            root = tree.getroot()
+        except ET.ParseError as e:
+            print(f"Error parsing XML file '{input_path}': {e}")
+            for future in futures:
+                future.cancel()
+            return
+
+        now = datetime.utcnow()
+        main_part = now.strftime('%Y-%m-%dT%H:%M:%S')
+        milliseconds = f'{now.microsecond // 1000:03d}'
+        created_timestamp = f'{main_part}.{milliseconds}Z'
+
+        new_version_ids = []
+        for update, future in zip(updates, futures):
+            try:
+                chunks, content_size = future.result()
+            except OSError as e:
+                print(f"Error reading content file '{update['content_file']}': {e}")
+                return
+            print(f"Content for '{update['dsid']}' read successfully. Original size: {content_size} bytes.")
+            new_version_ids.append(
+                append_datastream_version(root, update, chunks, content_size, created_timestamp)
+            )
 
     try:
         tree.write(output_path, encoding='UTF-8', xml_declaration=True)
-        print(f"Successfully created new version '{new_version_id}'.")
+        for new_version_id in new_version_ids:
+            print(f"Successfully created new version '{new_version_id}'.")
         print(f"Modified FOXML file saved to '{output_path}'")
     except IOError as e:
         print(f"Error writing to output file '{output_path}': {e}")
 
 
+def update_foxml_datastream(input_path, output_path, dsid, content_file, label, mimetype, control_group):
+    """
+    Adds or replaces a datastream in a FOXML file with Base64 encoded content,
+    with precise indentation and multi-line formatting that preserves the original document's style.
+
+    Args:
+        input_path (str): Path to the source FOXML file.
+        output_path (str): Path to save the modified FOXML file.
+        dsid (str): The ID of the datastream to add/update (e.g., 'OBJ', 'MODS').
+        content_file (str): Path to the file containing the new content.
+        label (str): The label for the new datastream version.
+        mimetype (str): The MIME type of the content file.
+        control_group (str): The control group for the datastream (e.g., 'M', 'X').
+    """
+    update_foxml_datastreams(input_path, output_path, [{
+        'dsid': dsid,
+        'content_file': content_file,
+        'label': label,
+        'mimetype': mimetype,
+        'control_group': control_group,
+    }])
+
+
 if __name__ == '__main__':
     parser = argparse.ArgumentParser(
-        description='Add or update a datastream in a FOXML file with Base64 encoded content.',
+        description='Add or update one or more datastreams in a FOXML file with Base64 encoded content.',
         formatter_class=argparse.RawTextHelpFormatter
     )
     parser.add_argument(
@@ -145,38 +240,73 @@ if __name__ == '__main__':
     parser.add_argument(
         '--dsid',
         required=True,
-        help='The ID for the datastream (e.g., "OBJ", "MODS", "FULL_TEXT").'
+        action='append',
+        help='The ID for the datastream (e.g., "OBJ", "MODS", "FULL_TEXT").\nRepeat to update several datastreams in one pass; each ID may be given only once.'
     )
     parser.add_argument(
         '-f', '--file',
         required=True,
+        action='append',
         dest='content_file',
-        help='Path to the file to be used as the new datastream content.'
+        help='Path to the file to be used as the new datastream content.\nRepeat once per --dsid, in the same order.'
     )
     parser.add_argument(
         '--label',
-        default=None,
-        help='A human-readable label for the new datastream version. \n(default: "[dsid] datastream")'
+        action='append',
+        default=[],
+        help='A human-readable label for the new datastream version.\nIf repeated, give it once per --dsid, in the same order. \n(default: "[dsid] datastream")'
     )
     parser.add_argument(
         '--mimetype',
-        default=None,
-        help='The MIME type of the content file (e.g., "application/pdf").\n(default: auto-detected or "application/octet-stream")'
+        action='append',
+        default=[],
+        help='The MIME type of the content file (e.g., "application/pdf").\nIf repeated, give it once per --dsid, in the same order.\n(default: auto-detected or "application/octet-stream")'
     )
     parser.add_argument(
         '--control-group',
-        default='M',
+        action='append',
+        default=[],
         choices=['M', 'X', 'R', 'E'],
-        help='The control group for the datastream. \'M\' (Managed) is typical for binary content. \n(default: M)'
+        help='The control group for the datastream. \'M\' (Managed) is typical for binary content.\nIf repeated, give it once per --dsid, in the same order. \n(default: M)'
+    )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=None,
+        help='Number of threads used to read content files while the FOXML is parsed.\n(default: Python\'s ThreadPoolExecutor default)'
     )
     args = parser.parse_args()
 
-    update_foxml_datastream(
+    duplicate_dsids = sorted({dsid for dsid in args.dsid if args.dsid.count(dsid) > 1})
+    if duplicate_dsids:
+        parser.error(f"--dsid values must be unique; given more than once: {', '.join(duplicate_dsids)}")
+    if args.workers is not None and args.workers < 1:
+        parser.error('--workers must be at least 1.')
+    if len(args.content_file) != len(args.dsid):
+        parser.error('--file must be given exactly once per --dsid.')
+    for option in ('label', 'mimetype', 'control_group'):
+        values = getattr(args, option)
+        if values and len(values) != len(args.dsid):
+            parser.error(f"--{option.replace('_', '-')} must be given either not at all or exactly once per --dsid.")
+        if not values:
+            setattr(args, option, [None] * len(args.dsid))
+
+    updates = [
+        {
+            'dsid': dsid,
+            'content_file': content_file,
+            'label': label,
+            'mimetype': mimetype,
+            'control_group': control_group,
+        }
+        for dsid, content_file, label, mimetype, control_group in zip(
+            args.dsid, args.content_file, args.label, args.mimetype, args.control_group
+        )
+    ]
+
+    update_foxml_datastreams(
         input_path=args.input_foxml,
         output_path=args.output_foxml,
-        dsid=args.dsid,
-        content_file=args.content_file,
-        label=args.label,
-        mimetype=args.mimetype,
-        control_group=args.control_group
-    )
\ No newline at end of file
+        updates=updates,
+        max_workers=args.workers
+    )